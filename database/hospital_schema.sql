@@ -231,6 +231,20 @@ ALTER TABLE ONLY public.patients
     ADD CONSTRAINT patients_pkey PRIMARY KEY (patient_id);
 
 
+--
+-- Name: ux_appointments_doctor_slot; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE UNIQUE INDEX ux_appointments_doctor_slot ON public.appointments USING btree (doctor_id, appointment_datetime) WHERE (status = 'Scheduled'::public.appointment_status_enum);
+
+
+--
+-- Name: ix_patients_phone; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE UNIQUE INDEX ix_patients_phone ON public.patients USING btree (phone);
+
+
 --
 -- Name: appointments appointments_doctor_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: postgres
 --
@@ -1,5 +1,7 @@
+import uuid
+
 import streamlit as st
-from main import get_medibot_response  
+from main import KnowledgeBaseError, get_medibot_response
 
 st.set_page_config(page_title="MediBot", page_icon="🩺")
 st.title("🏥 MediBot — AI Appointment Assistant")
@@ -10,8 +12,15 @@ if "chat" not in st.session_state:
 user_input = st.chat_input("Type your message...")
 if user_input:
     st.session_state.chat.append(("You", user_input))
-    with st.spinner("Thinking..."):
-        reply = get_medibot_response(user_input)  
+    try:
+        with st.spinner("Thinking..."):
+            reply = get_medibot_response(user_input, st.session_state.setdefault("thread_id", uuid.uuid4().hex))
+    except KnowledgeBaseError as e:
+        # The details (Pinecone / PDF errors) go to the server log, not the patient-facing page
+        print(f"ERROR: {str(e)}")
+        st.session_state.chat.pop()
+        st.error("MediBot is temporarily unavailable: the medical knowledge base could not be loaded. Please try again later.")
+        st.stop()
     st.session_state.chat.append(("MediBot", reply))
 
 for role, msg in st.session_state.chat: